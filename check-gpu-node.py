@@ -4,16 +4,30 @@ Kubernetes 클러스터에서 GPU 노드 존재/상태(Ready)를 점검하는 
 - GPU 판별: node.status.capacity 에 다음 키들 중 하나가 있고 값 > 0
     - 'nvidia.com/gpu', 'amd.com/gpu', 'gpu.intel.com/i915', 'intel.com/gpu'
 - Ready 판별: NodeCondition(type='Ready', status='True')
+- 파싱: V1Node 모델 대신 apiserver 응답 JSON을 dict로 직접 읽음 (orjson 설치 시 orjson 사용)
 - 실행 환경:
     - 기본: 로컬 kubeconfig(기본 경로 자동 탐지)
     - --kubeconfig 경로 직접 지정
+- 노드 조회: 기본적으로 resourceVersion=0 으로 apiserver watch cache 에서 조회
+    - --strict-consistency: etcd 에서 최신 상태를 직접 조회
+    - --page-size: limit/continue 로 N개씩 나눠 조회하고 페이지마다 GPU 노드만 남김 (기본: 500)
+    - --cache-ttl: watch 모드에서 재동기화 LIST 결과를 TTL 동안 재사용 (기본: 0, watch 이벤트/410/연결 오류 시 무효화)
+        - --watch-resync 보다 길어야 효과가 있음 (이벤트가 없던 재동기화의 LIST 를 생략), 1회 실행 모드에서는 효과 없음
+    - --gpu-node-selector: 라벨 셀렉터로 apiserver 에서 후보 노드만 조회 (여러 번 지정 시 OR, 'nfd' 는 NFD 라벨)
+- watch 모드:
+    - --watch: 최초 LIST 후 watch 스트림으로 변경분만 반영, 상태가 바뀔 때만 출력/슬랙 전송
+    - --watch-resync: 전체 LIST 재동기화 주기(초) (기본: 60)
+    - 셀렉터가 여러 개면 전체 노드를 watch 하고 이벤트의 라벨을 셀렉터와 직접 비교해 걸러냄
+    - 연결 끊김/5xx 등 일시적 오류는 백오프 후 다시 LIST 부터 시작
 - 출력:
     - 기본: 요약 로그 + 표 형태 텍스트
     - --json: 기계가 읽기 쉬운 JSON
+    - --include-labels / --include-taints: JSON 출력에 노드 라벨/taint 포함
 - 슬랙 알림:
     - --slack-webhook: 슬랙 웹훅 URL (환경변수 SLACK_WEBHOOK_URL로도 설정 가능)
     - --slack-username: 슬랙 봇 사용자명 (기본: GPU Checker)
     - --slack-only-on-error: GPU 노드가 없거나 Ready 상태가 아닐 때만 슬랙 메시지 전송
+    - --slack-coalesce-window: watch 모드에서 일정 시간 동안의 상태 변경을 모아 한 번에 전송
 Exit Codes:
     0: Ready GPU 노드 ≥ 1
     2: GPU 노드 0
@@ -23,18 +37,33 @@ Exit Codes:
 
 from __future__ import annotations
 import argparse
+import atexit
 import json
 import os
+import queue
+import re
+import signal
 import sys
+import threading
 import time
-from typing import Dict, List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 
-import requests
-from requests.exceptions import ConnectionError, Timeout, RequestException
-from kubernetes import client, config
-from kubernetes.client import V1Node, V1NodeCondition
 from dotenv import load_dotenv
 
+# kubernetes/httpx/tenacity 는 import 비용이 커서(kubernetes 는 수백 개의 모델 모듈 로드) 사용하는 함수 안에서 import 함
+# (실제 점검 시에는 load_kube_config 에서 kubernetes 전체를 읽으므로, 절약되는 것은 --help/인자 오류 시의 시작 시간)
+if TYPE_CHECKING:
+    import httpx
+    from kubernetes import client
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경에서는 표준 json 사용
+    orjson = None
+
+# 노드 LIST 응답 JSON 파서
+json_loads = orjson.loads if orjson else json.loads
+
 
 GPU_RESOURCE_KEYS = [
     "nvidia.com/gpu",
@@ -42,77 +71,176 @@ GPU_RESOURCE_KEYS = [
     "gpu.intel.com/i915",
     "intel.com/gpu",
 ]
+_GPU_KEYS = frozenset(GPU_RESOURCE_KEYS)
+
+# Node Feature Discovery(NFD)가 GPU 벤더 PCI 장치에 붙이는 라벨 (NVIDIA/AMD/Intel)
+NFD_GPU_NODE_SELECTORS = [
+    "feature.node.kubernetes.io/pci-10de.present=true",
+    "feature.node.kubernetes.io/pci-1002.present=true",
+    "feature.node.kubernetes.io/pci-8086.present=true",
+]
+
+# apiserver 연결 풀 크기 (watch/재동기화 호출 간 TLS 연결 재사용)
+KUBE_CONNECTION_POOL_MAXSIZE = 10
+
+# 프로세스 전체에서 재사용하는 HTTP 클라이언트 (지연 생성)
+_API_CLIENT: Optional[client.ApiClient] = None
+_SLACK_CLIENT: Optional[httpx.Client] = None
+
+# GPU 노드 LIST 결과 캐시: (apiserver host, label selector, strict) -> (만료 시각, (items, resourceVersion))
+_NODE_LIST_CACHE: Dict[Tuple, Tuple[float, Tuple[List[Dict], str]]] = {}
+
+
+def slack_retry_exceptions() -> Tuple[type, ...]:
+    """재시도 대상 예외: 연결 실패, 연결 끊김(Connection reset), 타임아웃"""
+    import httpx
+
+    return (
+        httpx.ConnectError,
+        httpx.ReadError,
+        httpx.RemoteProtocolError,
+        httpx.TimeoutException,
+    )
+
+
+def _is_retryable_response(response: httpx.Response) -> bool:
+    """슬랙 측 일시적 오류(rate limit, 5xx)인지 판단합니다."""
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP-date)를 대기 시간(초)으로 변환합니다. 없거나 잘못된 값이면 None."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def get_slack_client() -> httpx.Client:
+    """슬랙 웹훅 전송용 httpx.Client 를 반환합니다. 재시도/재전송 시 연결을 재사용합니다."""
+    global _SLACK_CLIENT
+    if _SLACK_CLIENT is None:
+        import httpx
+
+        _SLACK_CLIENT = httpx.Client(timeout=10)
+        atexit.register(_SLACK_CLIENT.close)
+    return _SLACK_CLIENT
+
+
+# 슬랙 연결 예열(HEAD) 타임아웃(초)
+SLACK_WARMUP_TIMEOUT = 2
+
+
+def warm_slack_connection(webhook_url: str) -> None:
+    """
+    슬랙 웹훅 호스트에 미리 연결(DNS 조회 + TLS 핸드셰이크)해 둡니다.
+    연결은 httpx.Client 풀에 남아 이후 메시지 전송 시 재사용되며, 실패해도 무시합니다.
+    """
+    try:
+        get_slack_client().head(webhook_url, timeout=SLACK_WARMUP_TIMEOUT)
+    except Exception:
+        pass
 
 
 def send_slack_message(webhook_url: str, message: str, username: str = "k8s-gpu-checker", 
                       max_retries: int = 3, retry_delay: int = 30) -> bool:
     """
-    슬랙 웹훅을 통해 메시지를 전송합니다. 네트워크 오류시 재시도합니다.
+    슬랙 웹훅을 통해 메시지를 전송합니다. 네트워크 오류시 지수 백오프(jitter 포함)로 재시도합니다.
+    429 응답에 Retry-After 헤더가 있으면 그 시간(최대 retry_delay)만큼 기다린 뒤 재시도합니다.
     
     Args:
         webhook_url: 슬랙 웹훅 URL
         message: 전송할 메시지
         username: 봇 사용자명
         max_retries: 최대 재시도 횟수 (기본: 3)
-        retry_delay: 재시도 간격(초) (기본: 30)
+        retry_delay: 재시도 최대 대기 시간(초) (기본: 30)
     
     Returns:
         bool: 전송 성공 여부
     """
     if not webhook_url:
         return False
+
+    import httpx
+    import tenacity
     
     payload = {
         "text": message,
         "username": username,
         "icon_emoji": ":robot_face:"
     }
-    
-    for attempt in range(max_retries + 1):  # 0, 1, 2, 3 (총 4번 시도)
-        try:
-            response = requests.post(
-                webhook_url, 
-                json=payload,
-                timeout=10,
-                headers={"Content-Type": "application/json"}
-            )
-            if response.status_code == 200:
-                if attempt > 0:
-                    print(f"✅ 슬랙 메시지를 {attempt + 1}번째 시도에서 성공적으로 전송했습니다.", file=sys.stderr)
-                return True
-            else:
-                print(f"슬랙 메시지 전송 실패 (HTTP {response.status_code}): {response.text}", file=sys.stderr)
-                
-        except (ConnectionError, Timeout) as e:
-            # 네트워크 연결 오류나 타임아웃의 경우 재시도
-            if "Connection reset by peer" in str(e) or "Connection aborted" in str(e):
-                if attempt < max_retries:
-                    print(f"슬랙 메시지 전송 실패 ({attempt + 1}/{max_retries + 1}회 시도): {e}", file=sys.stderr)
-                    print(f"⏳ {retry_delay}초 후 재시도합니다...", file=sys.stderr)
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    print(f"슬랙 메시지 전송 최종 실패: {e}", file=sys.stderr)
-                    return False
-            else:
-                print(f"슬랙 메시지 전송 실패: {e}", file=sys.stderr)
-                return False
-                
-        except RequestException as e:
-            # 기타 requests 관련 예외
-            print(f"슬랙 메시지 전송 실패: {e}", file=sys.stderr)
-            return False
-            
-        except Exception as e:
-            # 기타 예외
-            print(f"슬랙 메시지 전송 실패: {e}", file=sys.stderr)
-            return False
-    
-    return False
 
+    retry_exceptions = slack_retry_exceptions()
 
-def format_slack_message(gpu_nodes: List[Dict], ready_gpu_nodes: List[Dict]) -> str:
-    """GPU 노드 상태를 슬랙 메시지 형식으로 포맷합니다."""
+    def log_retry(retry_state: tenacity.RetryCallState) -> None:
+        outcome = retry_state.outcome
+        if outcome.failed:
+            reason = outcome.exception()
+        else:
+            reason = f"HTTP {outcome.result().status_code}"
+        print(f"슬랙 메시지 전송 실패 ({retry_state.attempt_number}/{max_retries + 1}회 시도): {reason}", file=sys.stderr)
+        print(f"⏳ {retry_state.next_action.sleep:.1f}초 후 재시도합니다...", file=sys.stderr)
+
+    backoff = tenacity.wait_random_exponential(multiplier=1, max=retry_delay)
+
+    def wait(retry_state: tenacity.RetryCallState) -> float:
+        # 429 응답에 Retry-After 가 있으면 그 값만큼 대기 (retry_delay 가 상한), 그 외에는 지수 백오프
+        outcome = retry_state.outcome
+        if not outcome.failed and outcome.result().status_code == 429:
+            retry_after = _retry_after_seconds(outcome.result())
+            if retry_after is not None:
+                return min(retry_after, retry_delay)
+        return backoff(retry_state)
+
+    retrying = tenacity.Retrying(
+        stop=tenacity.stop_after_attempt(max_retries + 1),
+        wait=wait,
+        retry=(
+            tenacity.retry_if_exception_type(retry_exceptions)
+            | tenacity.retry_if_result(_is_retryable_response)
+        ),
+        before_sleep=log_retry,
+        # 재시도를 모두 소진하면 마지막 응답을 반환하거나 마지막 예외를 그대로 던짐
+        retry_error_callback=lambda retry_state: retry_state.outcome.result(),
+    )
+
+    try:
+        response = retrying(get_slack_client().post, webhook_url, json=payload)
+    except retry_exceptions as e:
+        print(f"슬랙 메시지 전송 최종 실패: {e}", file=sys.stderr)
+        return False
+    except httpx.HTTPError as e:
+        # 기타 httpx 관련 예외
+        print(f"슬랙 메시지 전송 실패: {e}", file=sys.stderr)
+        return False
+    except Exception as e:
+        # 기타 예외
+        print(f"슬랙 메시지 전송 실패: {e}", file=sys.stderr)
+        return False
+
+    if response.status_code != 200:
+        print(f"슬랙 메시지 전송 실패 (HTTP {response.status_code}): {response.text}", file=sys.stderr)
+        return False
+
+    attempts = retrying.statistics.get("attempt_number", 1)
+    if attempts > 1:
+        print(f"✅ 슬랙 메시지를 {attempts}번째 시도에서 성공적으로 전송했습니다.", file=sys.stderr)
+    return True
+
+
+def format_slack_message(gpu_nodes: List[Dict], ready_gpu_nodes: List[Dict],
+                         changes: Optional[List[str]] = None) -> str:
+    """GPU 노드 상태를 슬랙 메시지 형식으로 포맷합니다. changes 가 있으면 변경 사항 목록을 덧붙입니다."""
     if ready_gpu_nodes:
         status_emoji = "✅"
         status_text = f"Ready 상태의 GPU 노드: {len(ready_gpu_nodes)}개 / 전체 GPU 노드: {len(gpu_nodes)}개"
@@ -135,10 +263,31 @@ def format_slack_message(gpu_nodes: List[Dict], ready_gpu_nodes: List[Dict]) ->
                 gpu_info += f" ({gpu_details})"
             
             message += f"\n• `{node['name']}`: {ready_status}, {gpu_info}"
+
+    if changes:
+        message += "\n\n*변경 사항:*"
+        for change in changes:
+            message += f"\n• {change}"
     
     return message
 
 
+def describe_node_changes(before: Dict[str, Tuple[bool, int]], after: Dict[str, Tuple[bool, int]]) -> List[str]:
+    """두 노드 상태 스냅샷(name -> (ready, gpus))을 비교해 노드별 변경 내역을 만듭니다."""
+    def describe(state: Optional[Tuple[bool, int]]) -> str:
+        if state is None:
+            return "없음"
+        ready, gpus = state
+        return f"{'✅ Ready' if ready else '❌ Not Ready'}, GPU: {gpus}"
+
+    changes = []
+    for name in sorted(before.keys() | after.keys()):
+        old, new = before.get(name), after.get(name)
+        if old != new:
+            changes.append(f"`{name}`: {describe(old)} → {describe(new)}")
+    return changes
+
+
 def get_slack_webhook_url(args: argparse.Namespace) -> Optional[str]:
     """슬랙 웹훅 URL을 가져옵니다 (인자 또는 환경변수에서)."""
     return args.slack_webhook or os.environ.get("SLACK_WEBHOOK_URL")
@@ -158,6 +307,8 @@ def should_send_slack_message(args: argparse.Namespace, gpu_nodes: List[Dict], r
 
 
 def load_kube_config(args: argparse.Namespace) -> None:
+    from kubernetes import config
+
     if args.kubeconfig:
         config.load_kube_config(config_file=args.kubeconfig)
         return
@@ -169,95 +320,249 @@ def load_kube_config(args: argparse.Namespace) -> None:
         config.load_kube_config()
 
 
-def is_ready(node: V1Node) -> bool:
-    if not node.status or not node.status.conditions:
-        return False
-    for cond in node.status.conditions:
-        if isinstance(cond, V1NodeCondition) and cond.type == "Ready" and cond.status == "True":
-            return True
-    return False
+def get_core_api() -> client.CoreV1Api:
+    """
+    연결 풀을 공유하는 CoreV1Api 를 반환합니다.
+    load_kube_config 이후 기본 설정을 복사해 ApiClient 하나를 만들고 재사용합니다.
+    """
+    from kubernetes import client
+
+    global _API_CLIENT
+    if _API_CLIENT is None:
+        configuration = client.Configuration.get_default_copy()
+        configuration.connection_pool_maxsize = KUBE_CONNECTION_POOL_MAXSIZE
+        _API_CLIENT = client.ApiClient(configuration)
+    return client.CoreV1Api(_API_CLIENT)
 
 
-def gpu_capacity(node: V1Node) -> Dict[str, int]:
+def is_ready(node: Dict) -> bool:
+    conditions = (node.get("status") or {}).get("conditions") or ()
+    # Ready 조건은 노드당 하나이므로 찾는 즉시 종료 (NotReady 노드도 나머지 조건을 훑지 않음)
+    ready = next((c for c in conditions if c.get("type") == "Ready"), None)
+    return ready is not None and ready.get("status") == "True"
+
+
+def gpu_capacity(node: Dict) -> Dict[str, int]:
     caps = {}
-    status = node.status or None
-    if not status or not status.capacity:
+    capacity = (node.get("status") or {}).get("capacity")
+    if not capacity:
+        return caps
+    # 대부분의 노드는 GPU 키가 없으므로 교집합으로 먼저 걸러냄
+    hits = _GPU_KEYS.intersection(capacity)
+    if not hits:
         return caps
     for key in GPU_RESOURCE_KEYS:
-        val = status.capacity.get(key)
+        if key not in hits:
+            continue
+        val = capacity[key]
         if not val:
             continue
         # Kubernetes resource quantities: 정수 문자열로 들어오는 경우가 일반적
         try:
-            caps[key] = int(str(val))
+            caps[key] = int(val)
         except Exception:
             # 혹시나 정수가 아닌 포맷이면 best-effort 무시
             pass
     return caps
 
 
-def extract_node_info(node: V1Node) -> Dict:
-    caps = gpu_capacity(node)
+def extract_node_info(node: Dict, caps: Optional[Dict[str, int]] = None,
+                      include_labels: bool = False, include_taints: bool = False) -> Dict:
+    metadata = node.get("metadata") or {}
+    if caps is None:
+        caps = gpu_capacity(node)
     total_gpus = sum(caps.values()) if caps else 0
-    return {
-        "name": node.metadata.name if node.metadata else "",
+    info = {
+        "name": metadata.get("name", ""),
         "ready": is_ready(node),
         "gpus": total_gpus,
         "gpu_breakdown": caps,
-        "labels": node.metadata.labels if node.metadata and node.metadata.labels else {},
-        "taints": [
-            {"key": t.key, "value": t.value, "effect": t.effect}
-            for t in (node.spec.taints or [])
-        ] if node.spec and getattr(node.spec, "taints", None) else [],
     }
+    # labels/taints 는 출력에 쓰이지 않으므로 요청된 경우에만 만듦
+    if include_labels:
+        info["labels"] = metadata.get("labels") or {}
+    if include_taints:
+        info["taints"] = [
+            {"key": t.get("key"), "value": t.get("value"), "effect": t.get("effect")}
+            for t in (node.get("spec") or {}).get("taints") or []
+        ]
+    return info
 
 
-def list_gpu_nodes(api: client.CoreV1Api) -> Tuple[List[Dict], List[Dict]]:
-    """Returns (gpu_nodes, ready_gpu_nodes) as list of dicts."""
-    nodes = api.list_node().items or []
-    gpu_nodes = []
-    ready_gpu_nodes = []
-    for n in nodes:
-        info = extract_node_info(n)
-        if info["gpus"] > 0:
-            gpu_nodes.append(info)
-            if info["ready"]:
-                ready_gpu_nodes.append(info)
+def node_info_options(args: argparse.Namespace) -> Dict[str, bool]:
+    """extract_node_info 에 전달할 옵션을 구성합니다."""
+    return {"include_labels": args.include_labels, "include_taints": args.include_taints}
+
+
+def node_list_options(args: argparse.Namespace) -> Dict[str, str]:
+    """list_node 호출에 사용할 옵션을 구성합니다."""
+    if args.strict_consistency:
+        # etcd에서 직접 읽는 최신(linearizable) 조회
+        return {}
+    # resourceVersion=0: apiserver watch cache에서 응답 (약간 오래된 데이터일 수 있음)
+    return {"resource_version": "0", "resource_version_match": "NotOlderThan"}
+
+
+def gpu_node_selectors(args: argparse.Namespace) -> List[Optional[str]]:
+    """
+    apiserver로 전달할 라벨 셀렉터 목록을 반환합니다.
+    라벨 셀렉터는 OR 조건을 표현할 수 없으므로 셀렉터마다 별도로 조회합니다.
+    지정하지 않으면 [None] (전체 노드 조회)을 반환합니다.
+    """
+    if not args.gpu_node_selector:
+        return [None]
+    selectors = []
+    for selector in args.gpu_node_selector:
+        if selector == "nfd":
+            selectors.extend(NFD_GPU_NODE_SELECTORS)
+        else:
+            selectors.append(selector)
+    return selectors
+
+
+def list_gpu_node_items(api: client.CoreV1Api, args: argparse.Namespace,
+                        label_selector: Optional[str] = None) -> Tuple[List[Tuple[Dict, Dict[str, int]]], str]:
+    """
+    GPU 노드의 (원본 dict, GPU capacity) 목록과 해당 목록의 resourceVersion을 반환합니다.
+    - V1Node 모델로 역직렬화하지 않고 원본 JSON을 dict 그대로 사용
+    - --page-size 단위로 나눠 조회하고, 페이지마다 GPU 노드만 남겨 전체 노드 목록을 메모리에 들고 있지 않음
+    - 캐시 TTL이 설정된 경우 TTL 동안 같은 조회 결과를 재사용
+    """
+    from kubernetes.client.rest import ApiException
+
+    ttl = args.cache_ttl
+    key = (api.api_client.configuration.host, label_selector, args.strict_consistency)
+    if ttl > 0:
+        cached = _NODE_LIST_CACHE.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+    first_page = dict(node_list_options(args))
+    if args.page_size > 0:
+        first_page["limit"] = args.page_size
+    options = first_page
+    items: List[Tuple[Dict, Dict[str, int]]] = []
+    restarted = False
+    while True:
+        try:
+            resp = api.list_node(label_selector=label_selector, _preload_content=False, **options)
+        except ApiException as e:
+            # 410 Gone: continue 토큰 만료 시 처음부터 한 번 다시 조회
+            if e.status != 410 or options is first_page or restarted:
+                raise
+            restarted = True
+            options, items = first_page, []
+            continue
+        try:
+            data = json_loads(resp.data)
+        finally:
+            # _preload_content=False 응답은 직접 반환해야 연결이 풀로 돌아감
+            resp.release_conn()
+        # GPU capacity 는 노드당 한 번만 계산해 이후 단계에서 재사용
+        for n in data.get("items") or ():
+            caps = gpu_capacity(n)
+            if sum(caps.values()) > 0:
+                items.append((n, caps))
+        metadata = data.get("metadata") or {}
+        token = metadata.get("continue")
+        if not token:
+            break
+        # continue 요청에는 resourceVersion 을 지정할 수 없음 (첫 페이지의 스냅샷을 이어서 조회)
+        options = {"limit": args.page_size, "_continue": token}
+
+    result = (items, metadata.get("resourceVersion", ""))
+    if ttl > 0:
+        _NODE_LIST_CACHE[key] = (time.monotonic() + ttl, result)
+    return result
+
+
+def invalidate_node_list_cache() -> None:
+    """노드 LIST 캐시를 비웁니다."""
+    _NODE_LIST_CACHE.clear()
+
+
+def fetch_nodes(api: client.CoreV1Api,
+                args: argparse.Namespace) -> Tuple[List[Tuple[Dict, Dict[str, int]]], str]:
+    """
+    셀렉터별로 GPU 노드를 조회하고 이름 기준으로 중복을 제거합니다.
+    Returns: (items, resourceVersion) — 셀렉터가 여러 개면 첫 번째 LIST 의 resourceVersion
+    (가장 먼저 조회한 시점이므로, 여기서부터 watch 하면 이후 LIST 사이의 변경도 놓치지 않음)
+    """
+    selectors = gpu_node_selectors(args)
+    if len(selectors) == 1:
+        return list_gpu_node_items(api, args, selectors[0])
+    nodes: Dict[str, Tuple[Dict, Dict[str, int]]] = {}
+    first_resource_version = ""
+    for selector in selectors:
+        items, resource_version = list_gpu_node_items(api, args, selector)
+        if not first_resource_version:
+            first_resource_version = resource_version
+        for item in items:
+            nodes[(item[0].get("metadata") or {}).get("name", "")] = item
+    return list(nodes.values()), first_resource_version
+
+
+def classify_nodes(items: List[Tuple[Dict, Dict[str, int]]],
+                   args: argparse.Namespace) -> Tuple[List[Dict], List[Dict]]:
+    """GPU 노드 (dict, capacity) 목록을 (gpu_nodes, ready_gpu_nodes)로 분류합니다."""
+    options = node_info_options(args)
+    gpu_nodes = [extract_node_info(n, caps, **options) for n, caps in items]
+    ready_gpu_nodes = [info for info in gpu_nodes if info["ready"]]
     return gpu_nodes, ready_gpu_nodes
 
 
+def list_gpu_nodes(api: client.CoreV1Api, args: argparse.Namespace) -> Tuple[List[Dict], List[Dict]]:
+    """Returns (gpu_nodes, ready_gpu_nodes) as list of dicts."""
+    return classify_nodes(fetch_nodes(api, args)[0], args)
+
+
 def print_table(gpu_nodes: List[Dict]) -> None:
     if not gpu_nodes:
         print("GPU 노드가 존재하지 않습니다.")
         return
 
-    # 동적 폭 계산
-    w_name = max(len("NAME"), max(len(node["name"]) for node in gpu_nodes))
+    # 한 번의 순회로 행 값과 이름 열 폭을 함께 계산
+    w_name = len("NAME")
+    cells = []
+    for node in gpu_nodes:
+        name = node["name"]
+        if len(name) > w_name:
+            w_name = len(name)
+        breakdown = node["gpu_breakdown"]
+        keys_str = ",".join(f"{k}:{v}" for k, v in breakdown.items()) if breakdown else "-"
+        cells.append((name, node["ready"], node["gpus"], keys_str))
     w_ready = len("READY")
     w_total = len("GPU(TOTAL)")
     w_keys = len("GPU(KEYS)")
 
-    print(f"{'NAME'.ljust(w_name)}  {'READY'.ljust(w_ready)}  {'GPU(TOTAL)'.ljust(w_total)}  {'GPU(KEYS)'}")
-    print(f"{'-'*w_name}  {'-'*w_ready}  {'-'*w_total}  {'-'*w_keys}")
-    for node in gpu_nodes:
-        keys_str = ",".join([f"{k}:{v}" for k, v in node["gpu_breakdown"].items()]) if node["gpu_breakdown"] else "-"
-        print(
-            f"{node['name'].ljust(w_name)}  "
-            f"{str(node['ready']).ljust(w_ready)}  "
-            f"{str(node['gpus']).ljust(w_total)}  "
-            f"{keys_str}"
-        )
-
+    # 열 폭을 미리 채운 포맷 문자열을 모든 행에 재사용
+    fmt = f"{{:<{w_name}}}  {{!s:<{w_ready}}}  {{!s:<{w_total}}}  {{}}".format
+    rows = [
+        fmt("NAME", "READY", "GPU(TOTAL)", "GPU(KEYS)"),
+        fmt("-" * w_name, "-" * w_ready, "-" * w_total, "-" * w_keys),
+    ]
+    rows.extend(fmt(*cell) for cell in cells)
+    # 행마다 print 하지 않고 한 번에 출력
+    print("\n".join(rows))
+
+
+def print_json(payload: Dict) -> None:
+    """payload 를 들여쓰기 된 JSON으로 stdout 에 출력합니다 (orjson 설치 시 orjson 사용)."""
+    if orjson:
+        # 텍스트 버퍼를 먼저 비워 출력 순서를 유지한 뒤 UTF-8 바이트를 그대로 기록
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    else:
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
 
-def one_shot(args: argparse.Namespace) -> int:
-    api = client.CoreV1Api()
-    gpu_nodes, ready_gpu_nodes = list_gpu_nodes(api)
 
-    # 슬랙 메시지 전송
+def send_slack_report(args: argparse.Namespace, gpu_nodes: List[Dict], ready_gpu_nodes: List[Dict],
+                      changes: Optional[List[str]] = None) -> None:
+    """전송 조건을 만족하면 GPU 노드 상태를 슬랙으로 전송합니다."""
     if should_send_slack_message(args, gpu_nodes, ready_gpu_nodes):
         webhook_url = get_slack_webhook_url(args)
         if webhook_url:
-            slack_message = format_slack_message(gpu_nodes, ready_gpu_nodes)
+            slack_message = format_slack_message(gpu_nodes, ready_gpu_nodes, changes)
             success = send_slack_message(
                 webhook_url, 
                 slack_message, 
@@ -270,13 +575,21 @@ def one_shot(args: argparse.Namespace) -> int:
             elif not success and not args.json:
                 print("❌ 슬랙 메시지 전송에 실패했습니다.", file=sys.stderr)
 
+
+def report(args: argparse.Namespace, gpu_nodes: List[Dict], ready_gpu_nodes: List[Dict],
+           send_slack: bool = True, changes: Optional[List[str]] = None) -> int:
+    """점검 결과를 출력하고 슬랙 메시지를 전송한 뒤 종료 코드를 반환합니다."""
+    # 슬랙 메시지 전송
+    if send_slack:
+        send_slack_report(args, gpu_nodes, ready_gpu_nodes, changes)
+
     if args.json:
         payload = {
             "total_nodes": len(gpu_nodes),
             "ready_nodes": len(ready_gpu_nodes),
             "nodes": gpu_nodes,
         }
-        print(json.dumps(payload, ensure_ascii=False, indent=2))
+        print_json(payload)
     else:
         if ready_gpu_nodes:
             print(f"✅ Ready 상태의 GPU 노드: {len(ready_gpu_nodes)}개 / 전체 GPU 노드: {len(gpu_nodes)}개")
@@ -293,12 +606,310 @@ def one_shot(args: argparse.Namespace) -> int:
     return 2  # gpu_nodes == 0
 
 
+def one_shot(args: argparse.Namespace) -> int:
+    api = get_core_api()
+    gpu_nodes, ready_gpu_nodes = list_gpu_nodes(api, args)
+    return report(args, gpu_nodes, ready_gpu_nodes)
+
+
+def watch_label_selector(args: argparse.Namespace) -> Optional[str]:
+    """
+    watch 스트림에 사용할 라벨 셀렉터를 반환합니다.
+    watch는 하나의 셀렉터만 받을 수 있으므로, 셀렉터가 여러 개면 전체 노드를 watch 하고
+    이벤트마다 node_matches_selectors 로 직접 걸러냅니다.
+    """
+    selectors = gpu_node_selectors(args)
+    return selectors[0] if len(selectors) == 1 else None
+
+
+# 라벨 셀렉터 요구 조건: "key", "!key", "key=value", "key==value", "key!=value", "key in (a,b)", "key notin (a,b)"
+_LABEL_KEY = r"[A-Za-z0-9][A-Za-z0-9._/-]*"
+_LABEL_VALUE = r"[A-Za-z0-9._-]*"
+_REQUIREMENT_RE = re.compile(
+    rf"^(?:(?P<not>!)\s*(?P<nkey>{_LABEL_KEY})"
+    rf"|(?P<key>{_LABEL_KEY})\s*(?:(?P<op>==|=|!=)\s*(?P<value>{_LABEL_VALUE})"
+    rf"|\s+(?P<setop>in|notin)\s*\((?P<values>[^()]*)\))?)$"
+)
+
+
+def parse_label_selector(selector: str) -> List[Tuple[str, str, Tuple[str, ...]]]:
+    """
+    라벨 셀렉터 문자열을 (key, operator, values) 요구 조건 목록으로 파싱합니다.
+    operator: "exists", "!", "in", "notin" ("=", "==" 는 "in", "!=" 는 "notin" 으로 정규화)
+    """
+    requirements = []
+    # 쉼표로 요구 조건을 나누되, in/notin 의 괄호 안 쉼표는 제외
+    for part in re.split(r",(?![^()]*\))", selector):
+        m = _REQUIREMENT_RE.match(part.strip())
+        if not m:
+            raise ValueError(f"지원하지 않는 라벨 셀렉터입니다: {selector!r}")
+        if m.group("not"):
+            requirements.append((m.group("nkey"), "!", ()))
+        elif m.group("op"):
+            op = "notin" if m.group("op") == "!=" else "in"
+            requirements.append((m.group("key"), op, (m.group("value"),)))
+        elif m.group("setop"):
+            values = tuple(v.strip() for v in m.group("values").split(","))
+            requirements.append((m.group("key"), m.group("setop"), values))
+        else:
+            requirements.append((m.group("key"), "exists", ()))
+    return requirements
+
+
+def watch_selector_filters(args: argparse.Namespace) -> Optional[List[List[Tuple[str, str, Tuple[str, ...]]]]]:
+    """
+    셀렉터가 여러 개라 전체 노드를 watch 할 때, 이벤트를 걸러낼 파싱된 셀렉터 목록을 반환합니다.
+    셀렉터가 없거나 하나면 apiserver 가 걸러주므로 None 을 반환합니다.
+    """
+    selectors = gpu_node_selectors(args)
+    if len(selectors) == 1:
+        return None
+    return [parse_label_selector(selector) for selector in selectors]
+
+
+def node_matches_selectors(node: Dict, selector_filters: List[List[Tuple[str, str, Tuple[str, ...]]]]) -> bool:
+    """노드 라벨이 셀렉터 중 하나라도(OR) 모든 요구 조건(AND)을 만족하는지 확인합니다."""
+    labels = (node.get("metadata") or {}).get("labels") or {}
+    for requirements in selector_filters:
+        for key, op, values in requirements:
+            if op == "exists":
+                matched = key in labels
+            elif op == "!":
+                matched = key not in labels
+            elif op == "in":
+                matched = key in labels and labels[key] in values
+            else:  # notin: 라벨이 없는 노드도 만족
+                matched = key not in labels or labels[key] not in values
+            if not matched:
+                break
+        else:
+            return True
+    return False
+
+
+def update_node_cache(node_cache: Dict[str, Tuple[str, Dict]], event_type: str, node: Dict,
+                      args: argparse.Namespace,
+                      previous: Optional[Dict[str, Tuple[str, Dict]]] = None,
+                      caps: Optional[Dict[str, int]] = None,
+                      selector_filters: Optional[List[List[Tuple[str, str, Tuple[str, ...]]]]] = None) -> None:
+    """
+    watch 이벤트 하나를 GPU 노드 캐시(name -> (resourceVersion, info))에 반영합니다.
+    resourceVersion 이 같은 노드는 다시 파싱하지 않고 기존 info 를 재사용합니다.
+    previous: 재동기화 시 이전 캐시 (지정하면 여기서 기존 info 를 찾음)
+    caps: 이미 계산된 GPU capacity (LIST 결과에서 전달)
+    selector_filters: 전체 노드를 watch 할 때 적용할 셀렉터 (어느 것에도 맞지 않는 노드는 캐시에서 제거)
+    """
+    metadata = node.get("metadata") or {}
+    name = metadata.get("name", "")
+    if event_type == "DELETED" or (selector_filters and not node_matches_selectors(node, selector_filters)):
+        node_cache.pop(name, None)
+        return
+    resource_version = metadata.get("resourceVersion", "")
+    cached = (node_cache if previous is None else previous).get(name)
+    if cached and resource_version and cached[0] == resource_version:
+        node_cache[name] = cached
+        return
+    if caps is None:
+        caps = gpu_capacity(node)
+    if sum(caps.values()) > 0:
+        node_cache[name] = (resource_version, extract_node_info(node, caps, **node_info_options(args)))
+    else:
+        node_cache.pop(name, None)
+
+
+# watch 스트림 클라이언트 측 타임아웃 여유(초, --watch-resync 에 더함): half-open 연결에서 멈추지 않도록
+WATCH_REQUEST_TIMEOUT_MARGIN = 15
+# 일시적 오류(연결 끊김, apiserver 재시작 등) 후 다시 LIST 하기 전 대기 시간(초): 지수 백오프 최소/최대
+WATCH_RETRY_MIN_DELAY = 1
+WATCH_RETRY_MAX_DELAY = 60
+
+
+def is_transient_watch_error(e: Exception) -> bool:
+    """watch 모드에서 다시 LIST 부터 재시도할 수 있는 일시적 오류인지 판단합니다."""
+    import urllib3
+    from kubernetes.client.rest import ApiException
+
+    if isinstance(e, ApiException):
+        # status 0: 응답 없이 끊긴 경우
+        return e.status == 0 or e.status == 429 or e.status >= 500
+    # ProtocolError(연결 끊김), ReadTimeoutError, MaxRetryError 등
+    return isinstance(e, (urllib3.exceptions.HTTPError, ConnectionError, TimeoutError))
+
+
+# watch 모드 종료 시 남은 슬랙 메시지 전송을 기다리는 여유 시간(초, 병합 윈도우에 더함)
+SLACK_FLUSH_MARGIN = 10
+
+
+def slack_coalesce_worker(args: argparse.Namespace, updates: queue.Queue) -> None:
+    """
+    watch 모드의 상태 변경을 --slack-coalesce-window 초 동안 모아 슬랙 메시지 한 건으로 보냅니다.
+    큐 항목: (이전 스냅샷, 현재 스냅샷, gpu_nodes, ready_gpu_nodes), None 을 받으면 남은 변경을 보내고 종료합니다.
+    """
+    stopping = False
+    while not stopping:
+        item = updates.get()
+        if item is None:
+            return
+        batch = [item]
+        deadline = time.monotonic() + args.slack_coalesce_window
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = updates.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+
+        before = batch[0][0]
+        _, after, gpu_nodes, ready_gpu_nodes = batch[-1]
+        if before is None:
+            # 최초 상태 보고
+            send_slack_report(args, gpu_nodes, ready_gpu_nodes)
+            continue
+        changes = describe_node_changes(before, after)
+        if changes:  # 윈도우 안에서 원래 상태로 돌아온 경우(flapping)는 전송하지 않음
+            send_slack_report(args, gpu_nodes, ready_gpu_nodes, changes)
+
+
+def wait_before_relist(error: str, delay: float) -> float:
+    """일시적 오류를 기록하고 delay 초 대기한 뒤, 다음 대기 시간(지수 백오프)을 반환합니다."""
+    print(f"⚠️ 노드 watch/LIST 오류: {error}", file=sys.stderr)
+    print(f"⏳ {delay}초 후 다시 LIST 합니다...", file=sys.stderr)
+    invalidate_node_list_cache()
+    time.sleep(delay)
+    return min(delay * 2, WATCH_RETRY_MAX_DELAY)
+
+
+def watch_loop(args: argparse.Namespace) -> int:
+    """
+    최초 LIST 후 watch 스트림으로 노드 변경분만 반영합니다.
+    - GPU 노드 상태(Ready/GPU 수)가 바뀔 때만 결과를 출력/전송 (edge-triggered)
+    - --watch-resync 초마다 스트림을 끊고 다시 LIST 하여 캐시를 재동기화
+    - 슬랙 메시지는 --slack-coalesce-window 초 동안의 변경을 모아 한 번에 전송
+    - 연결 끊김, apiserver 5xx 등 일시적 오류는 로그를 남기고 백오프 후 다시 LIST 부터 시작
+    - Ctrl+C 또는 SIGTERM 으로 종료하며, 마지막 점검 결과의 종료 코드를 반환
+    """
+    from kubernetes import watch
+    from kubernetes.client.rest import ApiException
+
+    api = get_core_api()
+    label_selector = watch_label_selector(args)
+    selector_filters = watch_selector_filters(args)
+    exit_code = 1
+    last_snapshot = None
+
+    # 슬랙 메시지 병합용 큐/스레드 (웹훅이 없거나 윈도우가 0이면 즉시 전송)
+    updates: Optional[queue.Queue] = None
+    coalescer: Optional[threading.Thread] = None
+    if get_slack_webhook_url(args) and args.slack_coalesce_window > 0:
+        updates = queue.Queue()
+        coalescer = threading.Thread(target=slack_coalesce_worker, args=(args, updates), daemon=True)
+        coalescer.start()
+
+    node_cache: Dict[str, Tuple[str, Dict]] = {}
+
+    def report_on_change() -> None:
+        nonlocal exit_code, last_snapshot
+        snapshot = {name: (info["ready"], info["gpus"]) for name, (_, info) in node_cache.items()}
+        if snapshot == last_snapshot:
+            return
+        before, last_snapshot = last_snapshot, snapshot
+        gpu_nodes = sorted((info for _, info in node_cache.values()), key=lambda info: info["name"])
+        ready_gpu_nodes = [info for info in gpu_nodes if info["ready"]]
+        if updates is not None:
+            exit_code = report(args, gpu_nodes, ready_gpu_nodes, send_slack=False)
+            updates.put((before, snapshot, gpu_nodes, ready_gpu_nodes))
+        else:
+            changes = describe_node_changes(before, snapshot) if before is not None else None
+            exit_code = report(args, gpu_nodes, ready_gpu_nodes, changes=changes)
+        sys.stdout.flush()
+
+    retry_delay = WATCH_RETRY_MIN_DELAY
+    # SIGTERM(kubectl delete, systemd stop 등)도 Ctrl+C 와 같이 KeyboardInterrupt 로 받아 남은 슬랙 메시지를 전송
+    previous_sigterm = signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        while True:
+            try:
+                # 셀렉터가 여러 개여도 1회 실행 모드와 같은 노드 집합이 되도록 셀렉터별로 LIST
+                items, resource_version = fetch_nodes(api, args)
+                retry_delay = WATCH_RETRY_MIN_DELAY
+                previous, node_cache = node_cache, {}
+                for n, caps in items:
+                    update_node_cache(node_cache, "ADDED", n, args, previous, caps)
+                report_on_change()
+
+                # return_type="object": 이벤트 객체를 V1Node로 역직렬화하지 않고 dict로 받음
+                w = watch.Watch(return_type="object")
+                for event in w.stream(
+                    api.list_node,
+                    label_selector=label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=args.watch_resync,
+                    # timeout_seconds 는 서버 측에서만 적용되므로 클라이언트 측 타임아웃도 지정
+                    _request_timeout=args.watch_resync + WATCH_REQUEST_TIMEOUT_MARGIN,
+                ):
+                    if event["type"] not in ("ADDED", "MODIFIED", "DELETED"):
+                        continue
+                    # 노드가 바뀌었으므로 캐시된 LIST 결과는 더 이상 유효하지 않음
+                    invalidate_node_list_cache()
+                    update_node_cache(node_cache, event["type"], event["object"], args,
+                                      selector_filters=selector_filters)
+                    report_on_change()
+            except ApiException as e:
+                # 410 Gone: resourceVersion 이 만료되었으므로 바로 다시 LIST 부터 시작
+                if e.status == 410:
+                    # 캐시된 LIST 는 만료된 resourceVersion 을 그대로 돌려주므로 반드시 비움
+                    invalidate_node_list_cache()
+                    continue
+                if not is_transient_watch_error(e):
+                    raise
+                retry_delay = wait_before_relist(f"HTTP {e.status} {e.reason}", retry_delay)
+            except Exception as e:
+                if not is_transient_watch_error(e):
+                    raise
+                retry_delay = wait_before_relist(str(e), retry_delay)
+    except KeyboardInterrupt:
+        return exit_code
+    finally:
+        if coalescer is not None:
+            # 아직 보내지 않은 변경 사항을 전송하고 종료 (대기 시간 제한, 다시 Ctrl+C 하면 바로 종료)
+            updates.put(None)
+            try:
+                coalescer.join(timeout=args.slack_coalesce_window + SLACK_FLUSH_MARGIN)
+            except KeyboardInterrupt:
+                pass
+            if coalescer.is_alive():
+                print("⚠️ 전송하지 못한 슬랙 메시지를 버리고 종료합니다.", file=sys.stderr)
+        signal.signal(signal.SIGTERM, previous_sigterm)
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Kubernetes GPU 노드 점검 스크립트")
     p.add_argument("--kubeconfig", help="kubeconfig 경로 직접 지정")
     p.add_argument("--json", action="store_true", help="JSON 형태로만 출력(머신 판독용)")
+    p.add_argument("--include-labels", action="store_true", help="JSON 출력에 노드 라벨 포함")
+    p.add_argument("--include-taints", action="store_true", help="JSON 출력에 노드 taint 포함")
+    p.add_argument("--strict-consistency", action="store_true",
+                   help="apiserver 캐시 대신 etcd에서 최신 노드 목록을 조회 (기본: watch cache 사용)")
+    p.add_argument("--gpu-node-selector", action="append", metavar="SELECTOR",
+                   help="GPU 노드 라벨 셀렉터 (여러 번 지정 시 OR). 'nfd' 지정 시 NFD GPU 벤더 라벨 사용. "
+                        "watch 모드에서 여러 개면 전체 노드를 watch 하고 라벨을 직접 비교")
+    p.add_argument("--page-size", type=int, default=500, metavar="N",
+                   help="노드 목록을 N개씩 나눠 조회 (limit/continue), 0이면 한 번에 조회 (기본: 500)")
+    p.add_argument("--cache-ttl", type=float, default=0, metavar="SECONDS",
+                   help="노드 LIST 결과 캐시 TTL(초), 0이면 사용 안 함 (기본: 0). "
+                        "watch 모드에서 --watch-resync 보다 길게 주면 이벤트가 없던 재동기화는 LIST 를 생략. "
+                        "1회 실행 모드에서는 LIST가 한 번뿐이라 효과 없음")
+
+    # watch 모드 옵션들
+    watch_group = p.add_argument_group("watch 모드", "종료하지 않고 노드 변경을 계속 감시하는 옵션들")
+    watch_group.add_argument("--watch", action="store_true", help="watch 스트림으로 노드 상태 변경을 계속 감시 (상태가 바뀔 때만 출력/전송)")
+    watch_group.add_argument("--watch-resync", type=int, default=60, help="watch 모드에서 전체 LIST로 재동기화하는 주기(초) (기본: 60)")
 
     # 슬랙 관련 옵션들
     slack_group = p.add_argument_group("슬랙 알림", "슬랙으로 메시지를 전송하는 옵션들")
@@ -306,15 +917,27 @@ def parse_args() -> argparse.Namespace:
     slack_group.add_argument("--slack-username", default="k8s-gpu-checker", help="슬랙 봇 사용자명 (기본: k8s-gpu-checker)")
     slack_group.add_argument("--slack-only-on-error", action="store_true", help="GPU 노드가 없거나 Ready 상태가 아닐 때만 슬랙 메시지 전송")
     slack_group.add_argument("--slack-retry-count", type=int, default=3, help="슬랙 메시지 전송 실패시 최대 재시도 횟수 (기본: 3)")
-    slack_group.add_argument("--slack-retry-delay", type=int, default=30, help="슬랙 메시지 재시도 간격(초) (기본: 30)")
+    slack_group.add_argument("--slack-retry-delay", type=int, default=30, help="슬랙 메시지 재시도 최대 대기 간격(초), 지수 백오프 및 429 Retry-After 상한 (기본: 30)")
+    slack_group.add_argument("--slack-coalesce-window", type=float, default=5,
+                             help="watch 모드에서 상태 변경을 모아 한 번에 전송하는 시간(초), 0이면 즉시 전송 (기본: 5)")
 
     return p.parse_args()
 
 
 def main() -> int:
     args = parse_args()
+
+    # kube LIST 와 겹치도록 슬랙 연결을 백그라운드에서 미리 맺어 둠
+    webhook_url = get_slack_webhook_url(args)
+    if webhook_url:
+        get_slack_client()  # 스레드 간 경쟁 없이 클라이언트를 먼저 생성
+        # daemon 스레드: 슬랙 호스트가 느리거나 응답이 없어도 프로세스 종료를 늦추지 않음
+        threading.Thread(target=warm_slack_connection, args=(webhook_url,), daemon=True).start()
+
     try:
         load_kube_config(args)
+        if args.watch:
+            return watch_loop(args)
         return one_shot(args)
     except Exception as e:
         # 오류 상황에서도 JSON 모드일 경우 기계가 읽기 쉬운 에러 출력